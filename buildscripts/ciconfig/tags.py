@@ -29,7 +29,7 @@ class TagsConfig(object):
         self.raw = raw
         self._conf = self.raw["selector"]
         self._conf_copy = copy.deepcopy(self._conf)
-        self._cmp_func = cmp_func
+        self._sort_key = cmp_to_key(cmp_func) if cmp_func else None
 
     @classmethod
     def from_file(cls, filename, **kwargs):
@@ -65,13 +65,17 @@ class TagsConfig(object):
         patterns = getdefault(self._conf, test_kind, {})
         return getdefault(patterns, test_pattern, [])
 
+    def has_tag(self, test_kind, test_pattern, tag):
+        """Return True if 'tag' is present under 'test_kind' and 'test_pattern'."""
+        return tag in self.get_tags(test_kind, test_pattern)
+
     def add_tag(self, test_kind, test_pattern, tag):
         """Add a tag. Return True if the tag is added or False if the tag was already present."""
         patterns = setdefault(self._conf, test_kind, {})
         tags = setdefault(patterns, test_pattern, [])
         if tag not in tags:
             tags.append(tag)
-            tags.sort(key=cmp_to_key(self._cmp_func) if self._cmp_func else None)
+            tags.sort(key=self._sort_key)
             return True
         return False
 
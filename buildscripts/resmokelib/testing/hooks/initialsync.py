@@ -4,7 +4,6 @@ import os.path
 import random
 
 import bson
-import bson.errors
 import pymongo.errors
 
 from . import cleanup
@@ -14,6 +13,19 @@ from ..fixtures import interface as fixture_interface
 from ..fixtures import replicaset
 from ... import errors
 
+_WAIT_FOR_SECONDARY_TIMEOUT_MILLIS = (
+    fixture_interface.ReplFixture.AWAIT_REPL_TIMEOUT_FOREVER_MINS * 60 * 1000)
+
+
+def _wait_for_secondary_cmd():
+    """Return a replSetTest command that waits for the node to reach SECONDARY state.
+
+    A new document is built on each call because pymongo adds session fields such as 'lsid' and
+    '$clusterTime' to the command document it is given.
+    """
+    return bson.SON([("replSetTest", 1), ("waitForMemberState", 2),
+                     ("timeoutMillis", _WAIT_FOR_SECONDARY_TIMEOUT_MILLIS)])
+
 
 class BackgroundInitialSync(interface.Hook):
     """BackgroundInitialSync class.
@@ -78,11 +90,7 @@ class BackgroundInitialSyncTestCase(jsfile.DynamicJSTestCase):
                 " node to go into SECONDARY state", self._hook.tests_run)
             self._hook.tests_run = 0
 
-            cmd = bson.SON(
-                [("replSetTest", 1), ("waitForMemberState", 2),
-                 ("timeoutMillis",
-                  fixture_interface.ReplFixture.AWAIT_REPL_TIMEOUT_FOREVER_MINS * 60 * 1000)])
-            sync_node_conn.admin.command(cmd)
+            sync_node_conn.admin.command(_wait_for_secondary_cmd())
 
         # Check if the initial sync node is in SECONDARY state. If it's been 'n' tests, then it
         # should have waited to be in SECONDARY state and the test should be marked as a failure.
@@ -201,11 +209,7 @@ class IntermediateInitialSyncTestCase(jsfile.DynamicJSTestCase):
 
         # Do initial sync round.
         self.logger.info("Waiting for initial sync node to go into SECONDARY state")
-        cmd = bson.SON(
-            [("replSetTest", 1), ("waitForMemberState", 2),
-             ("timeoutMillis",
-              fixture_interface.ReplFixture.AWAIT_REPL_TIMEOUT_FOREVER_MINS * 60 * 1000)])
-        sync_node_conn.admin.command(cmd)
+        sync_node_conn.admin.command(_wait_for_secondary_cmd())
 
         # Run data validation and dbhash checking.
         self._js_test.run_test()
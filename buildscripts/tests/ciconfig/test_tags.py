@@ -53,17 +53,18 @@ class TestTagsConfig(unittest.TestCase):
         tags = self.conf.get_tags("js_test", "jstests/core/unknown.js")
         self.assertEqual([], tags)
 
+    def test_has_tag_unknown_kind(self):
+        self.assertFalse(self.conf.has_tag("java_test", "jstests/core/example.js", "tag1"))
+
     def test_add_tag_to_existing_list(self):
         test_kind = "cpp_unit_test"
         test_pattern = "build/**/auth/*"
         new_tag = "tag100"
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertNotIn(new_tag, tags)
+        self.assertFalse(self.conf.has_tag(test_kind, test_pattern, new_tag))
 
         self.conf.add_tag(test_kind, test_pattern, new_tag)
 
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertIn(new_tag, tags)
+        self.assertTrue(self.conf.has_tag(test_kind, test_pattern, new_tag))
 
     def test_add_tag_to_new_list(self):
         test_kind = "js_test"
@@ -74,8 +75,7 @@ class TestTagsConfig(unittest.TestCase):
 
         self.conf.add_tag(test_kind, test_pattern, new_tag)
 
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertIn(new_tag, tags)
+        self.assertTrue(self.conf.has_tag(test_kind, test_pattern, new_tag))
 
     def test_add_tag_to_empty_pattern(self):
         test_kind = "db_test"
@@ -86,32 +86,27 @@ class TestTagsConfig(unittest.TestCase):
 
         self.conf.add_tag(test_kind, test_pattern, new_tag)
 
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertIn(new_tag, tags)
+        self.assertTrue(self.conf.has_tag(test_kind, test_pattern, new_tag))
 
     def test_remove_tag(self):
         test_kind = "js_test"
         test_pattern = "jstests/core/example.js"
         tag = "tag1"
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertIn(tag, tags)
+        self.assertTrue(self.conf.has_tag(test_kind, test_pattern, tag))
 
         self.conf.remove_tag(test_kind, test_pattern, tag)
 
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertNotIn(tag, tags)
+        self.assertFalse(self.conf.has_tag(test_kind, test_pattern, tag))
 
     def test_remove_unknown_tag(self):
         test_kind = "js_test"
         test_pattern = "jstests/core/example.js"
         tag = "tag18"
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertNotIn(tag, tags)
+        self.assertFalse(self.conf.has_tag(test_kind, test_pattern, tag))
 
         self.conf.remove_tag(test_kind, test_pattern, tag)
 
-        tags = self.conf.get_tags(test_kind, test_pattern)
-        self.assertNotIn(tag, tags)
+        self.assertFalse(self.conf.has_tag(test_kind, test_pattern, tag))
 
     def test_remove_tag_and_clean(self):
         test_kind = "js_test"
@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 #
 # Public Domain 2014-2020 MongoDB, Inc.
 # Public Domain 2008-2014 WiredTiger, Inc.
@@ -29,15 +29,26 @@
 
 # Generate input data to GNUplot from checkpoint information in a wtperf run
 
+import io
+import re
 import sys
 
+# Progress lines report the interval length as the eighth space-separated field, checkpoint lines
+# report their duration in milliseconds as the fourth.
+SECS_RE = re.compile(rb'^(?:[^ ]* ){7}(\d+)')
+CKPT_RE = re.compile(rb'^Finished checkpoint [^ ]* (\d+)')
+
+# Read the log through a large buffer, wtperf output is piped in and can be several gigabytes.
+stdin = io.open(sys.stdin.fileno(), 'rb', buffering=256 * 1024, closefd=False)
+
 time = 0 # seconds
-print("%d, %d" % (0, 0))
+out = ["%d, %d\n" % (0, 0)]
+
+for line in stdin:
+    if line.rstrip().endswith(b'secs'):
+        time += int(SECS_RE.match(line).group(1))
+    if line.startswith(b'Finished checkpoint'):
+        duration = (int(CKPT_RE.match(line).group(1)) + 500) // 1000 # convert ms to secs
+        out.append("%d, %d\n%d, %d\n" % (time - duration, 1, time, 0))
 
-for line in sys.stdin:
-    if line.strip().endswith('secs'):
-        time += int(line.split(' ')[7])
-    if line.startswith('Finished checkpoint'):
-        duration = (int(line.split(' ')[3]) + 500) / 1000 # convert ms to secs
-        print("%d, %d" % (time - duration, 1))
-        print("%d, %d" % (time, 0))
+sys.stdout.write(''.join(out))
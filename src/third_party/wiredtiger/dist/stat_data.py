@@ -26,7 +26,8 @@ class Stat:
     def __init__(self, name, tag, desc, flags=''):
         self.name = name
         self.desc = tag + ': ' + desc
-        self.flags = flags
+        # Split the comma-separated flags once so flag tests are set lookups.
+        self.flags = frozenset(f for f in flags.split(',') if f)
 
     def __cmp__(self, other):
         return cmp(self.desc.lower(), other.desc.lower())
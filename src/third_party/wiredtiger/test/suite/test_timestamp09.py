@@ -36,162 +36,164 @@ import wiredtiger, wttest
 def timestamp_str(t):
     return '%x' % t
 
+def commit_ts(t):
+    return 'commit_timestamp=%x' % t
+
+def oldest_ts(t):
+    return 'oldest_timestamp=%x' % t
+
+def stable_ts(t):
+    return 'stable_timestamp=%x' % t
+
+def oldest_stable_ts(oldest, stable):
+    return 'oldest_timestamp=%x,stable_timestamp=%x' % (oldest, stable)
+
+def read_ts(t):
+    return 'read_timestamp=%x' % t
+
 class test_timestamp09(wttest.WiredTigerTestCase, suite_subprocess):
     tablename = 'test_timestamp09'
     uri = 'table:' + tablename
     session_config = 'isolation=snapshot'
 
+    # Expected error messages, shared by the checks below.
+    older_than_first_msg = '/older than the first commit timestamp/'
+    less_than_oldest_msg = '/less than the oldest timestamp/'
+    less_than_stable_msg = '/less than the stable timestamp/'
+
     def test_timestamp_api(self):
-        self.session.create(self.uri, 'key_format=i,value_format=i')
-        c = self.session.open_cursor(self.uri)
+        session = self.session
+        conn = self.conn
+        session.create(self.uri, 'key_format=i,value_format=i')
+        c = session.open_cursor(self.uri)
 
         # Begin by adding some data.
-        self.session.begin_transaction()
-        self.session.commit_transaction(
-            'commit_timestamp=' + timestamp_str(1))
+        session.begin_transaction()
+        session.commit_transaction(commit_ts(1))
         c[1] = 1
 
         # In a single transaction it is illegal to set a commit timestamp
         # older than the first commit timestamp used for this transaction.
         # Check both timestamp_transaction and commit_transaction APIs.
-        self.session.begin_transaction()
-        self.session.timestamp_transaction(
-            'commit_timestamp=' + timestamp_str(3))
+        session.begin_transaction()
+        session.timestamp_transaction(commit_ts(3))
         c[3] = 3
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.session.timestamp_transaction(
-                'commit_timestamp=' + timestamp_str(2)),
-                '/older than the first commit timestamp/')
-        self.session.rollback_transaction()
-
-        self.session.begin_transaction()
-        self.session.timestamp_transaction(
-            'commit_timestamp=' + timestamp_str(4))
+            lambda: session.timestamp_transaction(commit_ts(2)),
+                self.older_than_first_msg)
+        session.rollback_transaction()
+
+        session.begin_transaction()
+        session.timestamp_transaction(commit_ts(4))
         c[4] = 4
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.session.commit_transaction(
-                'commit_timestamp=' + timestamp_str(3)),
-                '/older than the first commit timestamp/')
+            lambda: session.commit_transaction(commit_ts(3)),
+                self.older_than_first_msg)
 
         # Commit timestamp >= Oldest timestamp
         # Check both timestamp_transaction and commit_transaction APIs.
-        self.session.begin_transaction()
+        session.begin_transaction()
         c[3] = 3
-        self.session.commit_transaction(
-            'commit_timestamp=' + timestamp_str(3))
-        self.conn.set_timestamp('oldest_timestamp=' + timestamp_str(3))
+        session.commit_transaction(commit_ts(3))
+        conn.set_timestamp(oldest_ts(3))
 
-        self.session.begin_transaction()
+        session.begin_transaction()
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.session.timestamp_transaction(
-                'commit_timestamp=' + timestamp_str(2)),
-                '/less than the oldest timestamp/')
-        self.session.rollback_transaction()
+            lambda: session.timestamp_transaction(commit_ts(2)),
+                self.less_than_oldest_msg)
+        session.rollback_transaction()
 
-        self.session.begin_transaction()
+        session.begin_transaction()
         c[2] = 2
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.session.commit_transaction(
-                'commit_timestamp=' + timestamp_str(2)),
-                '/less than the oldest timestamp/')
+            lambda: session.commit_transaction(commit_ts(2)),
+                self.less_than_oldest_msg)
 
-        self.session.begin_transaction()
+        session.begin_transaction()
         c[4] = 4
-        self.session.commit_transaction(
-            'commit_timestamp=' + timestamp_str(4))
+        session.commit_transaction(commit_ts(4))
 
         # Oldest timestamp <= Stable timestamp and both oldest and stable
         # timestamp should proceed forward.
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.conn.set_timestamp('oldest_timestamp=' +
-                timestamp_str(3) + ',stable_timestamp=' + timestamp_str(1)),
-                '/oldest timestamp \(0, 3\) must not be later than stable timestamp \(0, 1\)/')
+            lambda: conn.set_timestamp(oldest_stable_ts(3, 1)),
+                r'/oldest timestamp \(0, 3\) must not be later than stable timestamp \(0, 1\)/')
 
         # Oldest timestamp is 3 at the moment, trying to set it to an earlier
         # timestamp is a no-op.
-        self.conn.set_timestamp('oldest_timestamp=' + timestamp_str(1))
-        self.assertTimestampsEqual(self.conn.query_timestamp('get=oldest'), timestamp_str(3))
+        conn.set_timestamp(oldest_ts(1))
+        self.assertTimestampsEqual(conn.query_timestamp('get=oldest'), timestamp_str(3))
 
-        self.conn.set_timestamp('oldest_timestamp=' + timestamp_str(3) +
-            ',stable_timestamp=' + timestamp_str(3))
-        self.conn.set_timestamp('stable_timestamp=' + timestamp_str(5))
+        conn.set_timestamp(oldest_stable_ts(3, 5))
         # Stable timestamp is 5 at the moment, trying to set it to an earlier
         # timestamp is a no-op.
-        self.conn.set_timestamp('stable_timestamp=' + timestamp_str(4))
-        self.assertTimestampsEqual(self.conn.query_timestamp('get=stable'), timestamp_str(5))
+        conn.set_timestamp(stable_ts(4))
+        self.assertTimestampsEqual(conn.query_timestamp('get=stable'), timestamp_str(5))
 
-        self.conn.set_timestamp('oldest_timestamp=' + timestamp_str(5))
+        conn.set_timestamp(oldest_ts(5))
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.conn.set_timestamp('oldest_timestamp=' +
-                timestamp_str(6)),
-                '/oldest timestamp \(0, 6\) must not be later than stable timestamp \(0, 5\)/')
+            lambda: conn.set_timestamp(oldest_ts(6)),
+                r'/oldest timestamp \(0, 6\) must not be later than stable timestamp \(0, 5\)/')
 
         # Commit timestamp >= Stable timestamp.
         # Check both timestamp_transaction and commit_transaction APIs.
         # Oldest and stable timestamp are set to 5 at the moment.
-        self.conn.set_timestamp('stable_timestamp=' + timestamp_str(6))
-        self.session.begin_transaction()
+        conn.set_timestamp(stable_ts(6))
+        session.begin_transaction()
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.session.timestamp_transaction(
-                'commit_timestamp=' + timestamp_str(5)),
-                '/less than the stable timestamp/')
-        self.session.rollback_transaction()
+            lambda: session.timestamp_transaction(commit_ts(5)),
+                self.less_than_stable_msg)
+        session.rollback_transaction()
 
-        self.session.begin_transaction()
+        session.begin_transaction()
         c[5] = 5
         self.assertRaisesWithMessage(wiredtiger.WiredTigerError,
-            lambda: self.session.commit_transaction(
-                'commit_timestamp=' + timestamp_str(5)),
-                '/less than the stable timestamp/')
+            lambda: session.commit_transaction(commit_ts(5)),
+                self.less_than_stable_msg)
 
         # When explicitly set, commit timestamp for a transaction can be earlier
         # than the commit timestamp of an earlier transaction.
-        self.session.begin_transaction()
+        session.begin_transaction()
         c[6] = 6
-        self.session.commit_transaction(
-            'commit_timestamp=' + timestamp_str(6))
-        self.session.begin_transaction()
+        session.commit_transaction(commit_ts(6))
+        session.begin_transaction()
         c[8] = 8
-        self.session.commit_transaction(
-            'commit_timestamp=' + timestamp_str(8))
-        self.session.begin_transaction()
+        session.commit_transaction(commit_ts(8))
+        session.begin_transaction()
         c[7] = 7
-        self.session.commit_transaction(
-            'commit_timestamp=' + timestamp_str(7))
+        session.commit_transaction(commit_ts(7))
 
         # Read timestamp >= Oldest timestamp
-        self.conn.set_timestamp('oldest_timestamp=' + timestamp_str(7) +
-            ',stable_timestamp=' + timestamp_str(7))
+        conn.set_timestamp(oldest_stable_ts(7, 7))
         with self.expectedStdoutPattern('less than the oldest timestamp'):
             self.assertRaisesException(wiredtiger.WiredTigerError,
-                lambda: self.session.begin_transaction('read_timestamp=' + timestamp_str(6)))
+                lambda: session.begin_transaction(read_ts(6)))
 
         # c[8] is not visible at read_timestamp < 8
-        self.session.begin_transaction('read_timestamp=' + timestamp_str(7))
+        session.begin_transaction(read_ts(7))
         self.assertEqual(c[6], 6)
         self.assertEqual(c[7], 7)
         c.set_key(8)
         self.assertEqual(c.search(), wiredtiger.WT_NOTFOUND)
-        self.session.commit_transaction()
+        session.commit_transaction()
 
-        self.session.begin_transaction('read_timestamp=' + timestamp_str(8))
+        session.begin_transaction(read_ts(8))
         self.assertEqual(c[6], 6)
         self.assertEqual(c[7], 7)
         self.assertEqual(c[8], 8)
         self.assertTimestampsEqual(
-            self.conn.query_timestamp('get=oldest_reader'), timestamp_str(8))
-        self.session.commit_transaction()
+            conn.query_timestamp('get=oldest_reader'), timestamp_str(8))
+        session.commit_transaction()
 
         # We can move the oldest timestamp backwards with "force"
-        self.conn.set_timestamp(
-            'oldest_timestamp=' + timestamp_str(5) + ',force')
+        conn.set_timestamp(oldest_ts(5) + ',force')
         with self.expectedStdoutPattern('less than the oldest timestamp'):
             self.assertRaisesException(wiredtiger.WiredTigerError,
-                lambda: self.session.begin_transaction('read_timestamp=' + timestamp_str(4)))
-        self.session.begin_transaction('read_timestamp=' + timestamp_str(6))
+                lambda: session.begin_transaction(read_ts(4)))
+        session.begin_transaction(read_ts(6))
         self.assertTimestampsEqual(
-            self.conn.query_timestamp('get=oldest_reader'), timestamp_str(6))
-        self.session.commit_transaction()
+            conn.query_timestamp('get=oldest_reader'), timestamp_str(6))
+        session.commit_transaction()
 
 if __name__ == '__main__':
     wttest.run()